@@ -7,7 +7,7 @@ from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
 from datetime import datetime
 import time
-from typing import Any
+from typing import Any, NamedTuple
 
 import aiohttp
 import voluptuous as vol
@@ -15,12 +15,18 @@ import voluptuous as vol
 from custom_components.mbapi2020.car import Car, CarAttribute, RcpOptions
 from custom_components.mbapi2020.const import (
     ATTR_MB_MANUFACTURER,
+    BUTTONS,
     CONF_ENABLE_CHINA_GCJ_02,
+    DEVICE_TRACKER,
     DOMAIN,
+    LOCKS,
     LOGGER,
     LOGIN_BASE_URI,
     MERCEDESME_COMPONENTS,
+    SENSORS,
+    SENSORS_POLL,
     UNITS,
+    BinarySensors,
     SensorConfigFields as scf,
 )
 from custom_components.mbapi2020.coordinator import MBAPI2020DataUpdateCoordinator
@@ -28,6 +34,7 @@ from custom_components.mbapi2020.errors import WebsocketError
 from custom_components.mbapi2020.helper import LogHelper as loghelper
 from custom_components.mbapi2020.services import setup_services
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -37,13 +44,33 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify
 
 CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
+SERVICES_REGISTERED = f"{DOMAIN}_services_registered"
+
+# Sensor config indices, resolved once instead of on every entity creation
+_DISPLAY_NAME = scf.DISPLAY_NAME.value
+_UNIT = scf.UNIT_OF_MEASUREMENT.value
+_OBJECT = scf.OBJECT_NAME.value
+_ATTRIBUTE = scf.ATTRIBUTE_NAME.value
+_VALUE_FIELD = scf.VALUE_FIELD_NAME.value
+_EXTENDED = scf.EXTENDED_ATTRIBUTE_LIST.value
+_ICON = scf.ICON.value
+_DEVICE_CLASS = scf.DEVICE_CLASS.value
+_FLIP_RESULT = scf.FLIP_RESULT.value
+_ENTITY_CATEGORY = scf.ENTITY_CATEGORY.value
+_STATE_CLASS = scf.STATE_CLASS.value
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up MBAPI2020."""
     LOGGER.debug("Start async_setup - Initializing services.")
     hass.data.setdefault(DOMAIN, {})
+
+    # Services are shared by all config entries, the schemas are registered only once
+    if hass.data.get(SERVICES_REGISTERED):
+        return True
+
     setup_services(hass)
+    hass.data[SERVICES_REGISTERED] = True
 
     return True
 
@@ -70,122 +97,28 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
             raise ConfigEntryAuthFailed()
 
         masterdata = await coordinator.client.webapi.get_user_info()
-        hass.async_add_executor_job(coordinator.client.write_debug_json_output, masterdata, "md", True)
-
-        for car in masterdata.get("assignedVehicles"):
-            # Check if the car has a separate VIN key, if not, use the FIN.
-            vin = car.get("vin")
-            if vin is None:
-                vin = car.get("fin")
-                LOGGER.debug(
-                    "VIN not found in masterdata. Used FIN %s instead.",
-                    loghelper.Mask_VIN(vin),
-                )
-
-            # Car is excluded, we do not add this
-            if vin in config_entry.options.get("excluded_cars", ""):
-                continue
-
-            features: dict[str, bool] = {}
-
-            try:
-                car_capabilities = await coordinator.client.webapi.get_car_capabilities(vin)
-                hass.async_add_executor_job(
-                    coordinator.client.write_debug_json_output,
-                    car_capabilities,
-                    f"cai-{loghelper.Mask_VIN(vin)}-",
-                    True,
-                )
-                if car_capabilities and "features" in car_capabilities:
-                    features.update(car_capabilities["features"])
-            except aiohttp.ClientError:
-                # For some cars a HTTP401 is raised when asking for capabilities, see github issue #83
-                LOGGER.info(
-                    "Car Capabilities not available for the car with VIN %s.",
-                    loghelper.Mask_VIN(vin),
-                )
+        coordinator.client.async_write_debug_json_output(masterdata, "md", True)
 
-            try:
-                capabilities = await coordinator.client.webapi.get_car_capabilities_commands(vin)
-                hass.async_add_executor_job(
-                    coordinator.client.write_debug_json_output,
-                    capabilities,
-                    f"ca-{loghelper.Mask_VIN(vin)}-",
-                    True,
-                )
-                if capabilities:
-                    for feature in capabilities.get("commands"):
-                        features[feature.get("commandName")] = bool(feature.get("isAvailable"))
-                        if feature.get("commandName", "") == "ZEV_PRECONDITION_CONFIGURE_SEATS":
-                            capabilityInformation = feature.get("capabilityInformation", None)
-                            if capabilityInformation and len(capabilityInformation) > 0:
-                                features[feature.get("capabilityInformation")[0]] = bool(feature.get("isAvailable"))
-            except aiohttp.ClientError:
-                # For some cars a HTTP401 is raised when asking for capabilities, see github issue #83
-                # We just ignore the capabilities
-                LOGGER.info(
-                    "Command Capabilities not available for the car with VIN %s. Make sure you disable the capability check in the option of this component.",
-                    loghelper.Mask_VIN(vin),
-                )
+        vehicles = [(car, _get_vin(car)) for car in masterdata.get("assignedVehicles")]
 
-            rcp_options = RcpOptions()
-            rcp_supported = await coordinator.client.webapi.is_car_rcp_supported(vin)
-            LOGGER.debug("RCP supported for car %s: %s", loghelper.Mask_VIN(vin), rcp_supported)
-            setattr(rcp_options, "rcp_supported", CarAttribute(rcp_supported, "VALID", 0))
-            rcp_supported = False
-            if rcp_supported:
-                rcp_supported_settings = await coordinator.client.webapi.get_car_rcp_supported_settings(vin)
-                if rcp_supported_settings:
-                    hass.async_add_executor_job(
-                        coordinator.client.write_debug_json_output,
-                        rcp_supported_settings,
-                        "rcs",
-                    )
-                    if rcp_supported_settings.get("data"):
-                        if rcp_supported_settings.get("data").get("attributes"):
-                            if rcp_supported_settings.get("data").get("attributes").get("supportedSettings"):
-                                LOGGER.debug(
-                                    "RCP supported settings: %s",
-                                    str(rcp_supported_settings.get("data").get("attributes").get("supportedSettings")),
-                                )
-                                setattr(
-                                    rcp_options,
-                                    "rcp_supported_settings",
-                                    CarAttribute(
-                                        rcp_supported_settings.get("data").get("attributes").get("supportedSettings"),
-                                        "VALID",
-                                        0,
-                                    ),
-                                )
-
-                                for setting in (
-                                    rcp_supported_settings.get("data").get("attributes").get("supportedSettings")
-                                ):
-                                    setting_result = await coordinator.client.webapi.get_car_rcp_settings(vin, setting)
-                                    if setting_result is not None:
-                                        hass.async_add_executor_job(
-                                            coordinator.client.write_debug_json_output,
-                                            setting_result,
-                                            f"rcs_{setting}",
-                                        )
-
-            current_car = Car(vin)
-            current_car.licenseplate = car.get("licensePlate", vin)
-            current_car.baumuster_description = (
-                car.get("salesRelatedInformation", "").get("baumuster", "").get("baumusterDescription", "")
-            )
-            if not current_car.licenseplate.strip():
-                current_car.licenseplate = vin
-            current_car.features = features
-            current_car.masterdata = car
-            current_car.rcp_options = rcp_options
-            current_car._last_message_received = int(round(time.time() * 1000))
-            current_car._is_owner = car.get("isOwner")
+        # The capability requests are independent per car, fetch them in one batch
+        caps_map = await coordinator.client.webapi.get_capabilities_batch(
+            [vin for _, vin in vehicles if vin not in coordinator.client.excluded_cars]
+        )
+        results = await asyncio.gather(
+            *[_process_car(coordinator, car, vin, caps_map) for car, vin in vehicles],
+            return_exceptions=True,
+        )
 
-            coordinator.client.cars[vin] = current_car
-            # await coordinator.client.update_poll_states(vin)
+        # Register the cars in masterdata order once all cars are processed
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            if result is None:
+                continue
 
-            LOGGER.debug("Init - car added - %s", loghelper.Mask_VIN(current_car.finorvin))
+            coordinator.client.cars[result.finorvin] = result
+            LOGGER.debug("Init - car added - %s", loghelper.Mask_VIN(result.finorvin))
 
         await coordinator.async_config_entry_first_refresh()
 
@@ -214,6 +147,215 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     return True
 
 
+async def _process_car(
+    coordinator: MBAPI2020DataUpdateCoordinator,
+    car: dict[str, Any],
+    vin: str,
+    caps_map: dict[str, dict[str, Any]],
+) -> Car | None:
+    """Create the car of a masterdata entry, return None if the car is excluded."""
+    # Car is excluded, we do not add this
+    if vin in coordinator.client.excluded_cars:
+        return None
+
+    car_caps = caps_map[vin]
+    features: dict[str, bool] = {}
+
+    car_capabilities = car_caps["capabilities"]
+    capabilities = car_caps["commands"]
+    rcp_supported = car_caps["rcp_supported"]
+
+    if isinstance(car_capabilities, aiohttp.ClientError):
+        # For some cars a HTTP401 is raised when asking for capabilities, see github issue #83
+        LOGGER.info(
+            "Car Capabilities not available for the car with VIN %s.",
+            loghelper.Mask_VIN(vin),
+        )
+    elif isinstance(car_capabilities, BaseException):
+        raise car_capabilities
+    else:
+        coordinator.client.async_write_debug_json_output(
+            car_capabilities,
+            f"cai-{loghelper.Mask_VIN(vin)}-",
+            True,
+        )
+        if car_capabilities and "features" in car_capabilities:
+            features.update(car_capabilities["features"])
+
+    if isinstance(capabilities, aiohttp.ClientError):
+        # For some cars a HTTP401 is raised when asking for capabilities, see github issue #83
+        # We just ignore the capabilities
+        LOGGER.info(
+            "Command Capabilities not available for the car with VIN %s. Make sure you disable the capability check in the option of this component.",
+            loghelper.Mask_VIN(vin),
+        )
+    elif isinstance(capabilities, BaseException):
+        raise capabilities
+    else:
+        coordinator.client.async_write_debug_json_output(
+            capabilities,
+            f"ca-{loghelper.Mask_VIN(vin)}-",
+            True,
+        )
+        if capabilities:
+            commands = capabilities.get("commands")
+            features.update((command.get("commandName"), bool(command.get("isAvailable"))) for command in commands)
+            for command in commands:
+                if command.get("commandName", "") == "ZEV_PRECONDITION_CONFIGURE_SEATS":
+                    capabilityInformation = command.get("capabilityInformation", None)
+                    if capabilityInformation and len(capabilityInformation) > 0:
+                        features[capabilityInformation[0]] = bool(command.get("isAvailable"))
+
+    if isinstance(rcp_supported, BaseException):
+        raise rcp_supported
+
+    rcp_options = RcpOptions()
+    LOGGER.debug("RCP supported for car %s: %s", loghelper.Mask_VIN(vin), rcp_supported)
+    setattr(rcp_options, "rcp_supported", CarAttribute(rcp_supported, "VALID", 0))
+    # Loading the RCP settings stays disabled as before, so the rcp_features sensor
+    # has no rcp_supported_settings attribute.
+    rcp_supported = False
+    if rcp_supported:
+        await _async_load_rcp_settings(coordinator, vin, rcp_options)
+
+    current_car = Car(vin)
+    current_car.licenseplate = car.get("licensePlate", vin)
+    current_car.baumuster_description = (
+        car.get("salesRelatedInformation", "").get("baumuster", "").get("baumusterDescription", "")
+    )
+    if not current_car.licenseplate.strip():
+        current_car.licenseplate = vin
+    current_car.features = features
+    current_car.masterdata = car
+    current_car.rcp_options = rcp_options
+    current_car._last_message_received = time.time_ns() // 1_000_000
+    current_car._is_owner = car.get("isOwner")
+
+    return current_car
+
+
+async def _async_load_rcp_settings(
+    coordinator: MBAPI2020DataUpdateCoordinator, vin: str, rcp_options: RcpOptions
+) -> None:
+    """Load the supported RCP settings of a car and store them in the rcp options."""
+    rcp_supported_settings = await coordinator.client.webapi.get_car_rcp_supported_settings(vin)
+    if not rcp_supported_settings:
+        return
+
+    coordinator.client.async_write_debug_json_output(
+        rcp_supported_settings,
+        "rcs",
+    )
+
+    supported_settings = ((rcp_supported_settings.get("data") or {}).get("attributes") or {}).get("supportedSettings")
+    if not supported_settings:
+        return
+
+    LOGGER.debug("RCP supported settings: %s", supported_settings)
+    setattr(rcp_options, "rcp_supported_settings", CarAttribute(supported_settings, "VALID", 0))
+
+    setting_results = await asyncio.gather(
+        *[coordinator.client.webapi.get_car_rcp_settings(vin, setting) for setting in supported_settings]
+    )
+    for setting, setting_result in zip(supported_settings, setting_results):
+        if setting_result is not None:
+            coordinator.client.async_write_debug_json_output(
+                setting_result,
+                f"rcs_{setting}",
+            )
+
+
+class EntitySpec(NamedTuple):
+    """Static entity settings derived from a sensor config."""
+
+    display_name: str
+    feature_name: str | None
+    object_name: str | None
+    attrib_name: str | None
+    flip_result: bool
+    device_class: str | None
+    icon: str | None
+    state_class: str | None
+    entity_category: str | None
+    attributes: tuple[str, ...] | None
+    extended_attributes: tuple[tuple[str, Callable[[Car], Any]], ...]
+    value_holder: Callable[[Car], Any]
+    translation_key: str
+
+
+def _build_entity_spec(internal_name: str, config: list) -> EntitySpec:
+    """Build the entity spec of a sensor config."""
+    attributes = tuple(sorted(config[_EXTENDED])) if config[_EXTENDED] is not None else None
+    return EntitySpec(
+        display_name=config[_DISPLAY_NAME],
+        feature_name=config[_OBJECT],
+        object_name=config[_ATTRIBUTE],
+        attrib_name=config[_VALUE_FIELD],
+        flip_result=config[_FLIP_RESULT],
+        device_class=config[_DEVICE_CLASS],
+        icon=config[_ICON],
+        state_class=config[_STATE_CLASS],
+        entity_category=config[_ENTITY_CATEGORY],
+        attributes=attributes,
+        extended_attributes=_resolve_extended_attributes(attributes, config[_OBJECT]),
+        value_holder=_car_value_holder(config[_OBJECT], config[_ATTRIBUTE]),
+        translation_key=internal_name.lower(),
+    )
+
+
+def _car_value_holder(feature: str | None, object_name: str | None) -> Callable[[Car], Any]:
+    """Return a function resolving the object that holds a car value.
+
+    The access path is fixed per entity, so it is resolved once instead of on every read.
+    """
+    if not object_name:
+        return lambda car: car
+    if not feature:
+        return lambda car: getattr(car, object_name, None)
+    return lambda car: getattr(getattr(car, feature, None), object_name, None)
+
+
+def _resolve_extended_attributes(
+    attributes: list[str] | tuple[str, ...] | None, feature: str | None
+) -> tuple[tuple[str, Callable[[Car], Any]], ...]:
+    """Resolve extended attributes into (attribute name, value holder) pairs."""
+    resolved = []
+    for attrib in attributes or []:
+        if "." in attrib:
+            object_name, attrib_name = attrib.split(".")[:2]
+        else:
+            object_name, attrib_name = feature, attrib
+        resolved.append((attrib_name, _car_value_holder(object_name, attrib_name)))
+    return tuple(resolved)
+
+
+# Entity specs per platform and internal name, the sensor configs are module constants
+_ENTITY_SPECS: dict[tuple[Platform, str], EntitySpec] = {
+    (platform, internal_name): _build_entity_spec(internal_name, config)
+    for platform, configs in (
+        (Platform.BINARY_SENSOR, BinarySensors),
+        (Platform.BUTTON, BUTTONS),
+        (Platform.DEVICE_TRACKER, DEVICE_TRACKER),
+        (Platform.LOCK, LOCKS),
+        (Platform.SENSOR, SENSORS),
+        (Platform.SENSOR, SENSORS_POLL),
+    )
+    for internal_name, config in configs.items()
+}
+
+
+def _get_vin(car: dict[str, Any]) -> str:
+    """Return the VIN of a masterdata car, use the FIN if the car has no separate VIN key."""
+    vin = car.get("vin")
+    if vin is None:
+        vin = car.get("fin")
+        LOGGER.debug(
+            "VIN not found in masterdata. Used FIN %s instead.",
+            loghelper.Mask_VIN(vin),
+        )
+    return vin
+
+
 async def config_entry_update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Update listener, called when the config entry options are changed."""
     LOGGER.debug("Start config_entry_update async_reload")
@@ -226,8 +368,16 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     unload_ok = False
 
     if len(hass.data[DOMAIN][config_entry.entry_id].client.cars) > 0:
-        await hass.data[DOMAIN][config_entry.entry_id].client.websocket.async_stop()
-        if unload_ok := await hass.config_entries.async_unload_platforms(config_entry, MERCEDESME_COMPONENTS):
+        stop_result, unload_ok = await asyncio.gather(
+            hass.data[DOMAIN][config_entry.entry_id].client.websocket.async_stop(),
+            hass.config_entries.async_unload_platforms(config_entry, MERCEDESME_COMPONENTS),
+            return_exceptions=True,
+        )
+        if isinstance(stop_result, BaseException):
+            LOGGER.warning("Error while stopping the websocket connection: %s", stop_result)
+        if isinstance(unload_ok, BaseException):
+            raise unload_ok
+        if unload_ok:
             del hass.data[DOMAIN][config_entry.entry_id]
     else:
         # No cars loaded, we destroy the config entry only
@@ -249,7 +399,34 @@ class MercedesMeEntityDescription(EntityDescription):
 class MercedesMeEntity(CoordinatorEntity[MBAPI2020DataUpdateCoordinator], Entity):
     """Entity class for MercedesMe devices."""
 
+    # The HA base classes keep a __dict__, the slots only cover the per car state of this class
+    __slots__ = (
+        "_hass",
+        "_coordinator",
+        "_vin",
+        "_internal_name",
+        "_sensor_config",
+        "_car",
+        "_feature_name",
+        "_object_name",
+        "_attrib_name",
+        "_value_holder",
+        "_extended_attributes",
+        "_flip_result",
+        "_state",
+        "_attrs_cache_ts",
+        "_attrs_cache",
+        "_ts_cache",
+        "_attributes",
+        "_use_chinese_location_data",
+        "_name",
+    )
+
     _attr_has_entity_name = True
+    # Platform of the sensor config dict the entity is created from, set by the platform classes
+    _entity_platform: Platform | None = None
+    # Poll sensors only change on coordinator refreshes and skip the websocket push updates
+    _subscribe_to_push = True
 
     def __init__(
         self,
@@ -257,7 +434,6 @@ class MercedesMeEntity(CoordinatorEntity[MBAPI2020DataUpdateCoordinator], Entity
         config: list | EntityDescription,
         vin: str,
         coordinator: MBAPI2020DataUpdateCoordinator,
-        should_poll: bool = False,
     ) -> None:
         """Initialize the MercedesMe entity."""
 
@@ -270,34 +446,44 @@ class MercedesMeEntity(CoordinatorEntity[MBAPI2020DataUpdateCoordinator], Entity
         self._feature_name = None
         self._object_name = None
         self._attrib_name = None
+        self._value_holder: Callable[[Car], Any] = _car_value_holder(None, None)
+        self._extended_attributes: tuple[tuple[str, Callable[[Car], Any]], ...] = ()
 
         self._flip_result = False
         self._state = None
+        self._attrs_cache_ts: int = -1
+        self._attrs_cache: dict[str, Any] | None = None
+        self._ts_cache: tuple[int, datetime] | None = None
 
         # Temporary workaround: If PR get's approved, all entity types should be migrated to the new config classes
         if isinstance(config, EntityDescription):
-            self._attributes = config.attributes
+            self._attributes = sorted(config.attributes) if config.attributes is not None else None
+            self._extended_attributes = _resolve_extended_attributes(self._attributes, self._feature_name)
             self.entity_description = config
         else:
-            self._feature_name = config[scf.OBJECT_NAME.value]
-            self._object_name = config[scf.ATTRIBUTE_NAME.value]
-            self._attrib_name = config[scf.VALUE_FIELD_NAME.value]
-            self._flip_result = config[scf.FLIP_RESULT.value]
-            self._attr_device_class = self._sensor_config[scf.DEVICE_CLASS.value]
-            self._attr_icon = self._sensor_config[scf.ICON.value]
-            self._attr_state_class = self._sensor_config[scf.STATE_CLASS.value]
-            self._attr_entity_category = self._sensor_config[scf.ENTITY_CATEGORY.value]
-            self._attributes = self._sensor_config[scf.EXTENDED_ATTRIBUTE_LIST.value]
+            spec = _ENTITY_SPECS.get((self._entity_platform, internal_name)) or _build_entity_spec(
+                internal_name, config
+            )
+            self._feature_name = spec.feature_name
+            self._object_name = spec.object_name
+            self._attrib_name = spec.attrib_name
+            self._value_holder = spec.value_holder
+            self._flip_result = spec.flip_result
+            self._attr_device_class = spec.device_class
+            self._attr_icon = spec.icon
+            self._attr_state_class = spec.state_class
+            self._attr_entity_category = spec.entity_category
+            self._attributes = spec.attributes
+            self._extended_attributes = spec.extended_attributes
             self._attr_native_unit_of_measurement = self.unit_of_measurement
             self._use_chinese_location_data: bool = self._coordinator.config_entry.options.get(
                 CONF_ENABLE_CHINA_GCJ_02, False
             )
-            self._attr_translation_key = self._internal_name.lower()
-            self._attr_name = config[scf.DISPLAY_NAME.value]
-            self._name = f"{self._car.licenseplate} {config[scf.DISPLAY_NAME.value]}"
+            self._attr_translation_key = spec.translation_key
+            self._attr_name = spec.display_name
+            self._name = f"{self._car.licenseplate} {spec.display_name}"
 
         self._attr_device_info = {"identifiers": {(DOMAIN, self._vin)}}
-        self._attr_should_poll = should_poll
         self._attr_unique_id = slugify(f"{self._vin}_{self._internal_name}")
 
         super().__init__(coordinator)
@@ -307,41 +493,53 @@ class MercedesMeEntity(CoordinatorEntity[MBAPI2020DataUpdateCoordinator], Entity
         if self._internal_name == "car":
             return "VALID"
 
-        return self._get_car_value(self._feature_name, self._object_name, "retrievalstatus", "error")
+        return self._get_value("retrievalstatus", "error")
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
 
+        # The attributes only change with new car data, reuse them until the next update
+        last_message_received = self._car._last_message_received
+        if self._attrs_cache is not None and last_message_received == self._attrs_cache_ts:
+            return self._attrs_cache
+
         state = {"car": self._car.licenseplate, "vin": self._vin}
 
+        value_holder = self._value_holder(self._car)
+
         if self._attrib_name == "display_value":
-            value = self._get_car_value(self._feature_name, self._object_name, "value", None)
+            value = getattr(value_holder, "value", None)
             if value:
                 state["original_value"] = value
 
         for item in ["retrievalstatus", "timestamp", "unit"]:
-            value = self._get_car_value(self._feature_name, self._object_name, item, None)
+            value = getattr(value_holder, item, None)
             if value:
-                state[item] = value if item != "timestamp" else datetime.fromtimestamp(int(value))
+                if item == "timestamp":
+                    # Most updates do not touch this value, reuse the last conversion
+                    timestamp = int(value)
+                    if self._ts_cache is None or self._ts_cache[0] != timestamp:
+                        self._ts_cache = (timestamp, datetime.fromtimestamp(timestamp))
+                    state[item] = self._ts_cache[1]
+                else:
+                    state[item] = value
 
         if self._attributes is not None:
-            for attrib in sorted(self._attributes):
-                if "." in attrib:
-                    object_name = attrib.split(".")[0]
-                    attrib_name = attrib.split(".")[1]
-                else:
-                    object_name = self._feature_name
-                    attrib_name = attrib
-                retrievalstatus = self._get_car_value(object_name, attrib_name, "retrievalstatus", "error")
+            for attrib_name, attrib_holder in self._extended_attributes:
+                car_attribute = attrib_holder(self._car)
+                retrievalstatus = getattr(car_attribute, "retrievalstatus", "error")
 
                 if retrievalstatus == "VALID":
-                    state[attrib_name] = self._get_car_value(object_name, attrib_name, "display_value", None)
+                    state[attrib_name] = getattr(car_attribute, "display_value", None)
                     if not state[attrib_name]:
-                        state[attrib_name] = self._get_car_value(object_name, attrib_name, "value", "error")
+                        state[attrib_name] = getattr(car_attribute, "value", "error")
 
                 if retrievalstatus in ["NOT_RECEIVED"]:
                     state[attrib_name] = "NOT_RECEIVED"
+
+        self._attrs_cache_ts = last_message_received
+        self._attrs_cache = state
         return state
 
     @property
@@ -358,10 +556,11 @@ class MercedesMeEntity(CoordinatorEntity[MBAPI2020DataUpdateCoordinator], Entity
     def unit_of_measurement(self):
         """Return the unit of measurement."""
 
-        if "unit" in self.extra_state_attributes:
-            reported_unit: str = self.extra_state_attributes["unit"]
-            if reported_unit.upper() in UNITS:
-                return UNITS[reported_unit.upper()]
+        reported_unit: str | None = self._get_value("unit", None)
+        if reported_unit:
+            mapped_unit = UNITS.get(reported_unit.upper())
+            if mapped_unit is not None:
+                return mapped_unit
 
             LOGGER.warning(
                 "Unknown unit %s found. Please report via issue https://www.github.com/renenulschde/mbapi2020/issues",
@@ -371,26 +570,32 @@ class MercedesMeEntity(CoordinatorEntity[MBAPI2020DataUpdateCoordinator], Entity
 
         if isinstance(self._sensor_config, EntityDescription):
             return None
-        return self._sensor_config[scf.UNIT_OF_MEASUREMENT.value]
+        return self._sensor_config[_UNIT]
 
     def update(self):
         """Get the latest data and updates the states."""
         if not self.enabled:
             return
 
+        self._attrs_cache = None
+
         if isinstance(self._sensor_config, EntityDescription):
             try:
                 self._mercedes_me_update()
             except Exception as err:
                 LOGGER.error("Error while updating entity %s: %s", self.name, err)
         else:
-            self._state = self._get_car_value(self._feature_name, self._object_name, self._attrib_name, "error")
+            self._state = self._get_value(self._attrib_name, "error")
             self.async_write_ha_state()
 
     def _mercedes_me_update(self) -> None:
         """Update Mercedes Me entity."""
         raise NotImplementedError
 
+    def _get_value(self, attrib_name, default_value):
+        """Return an attribute of the car value this entity represents."""
+        return getattr(self._value_holder(self._car), attrib_name, default_value)
+
     def _get_car_value(self, feature, object_name, attrib_name, default_value):
         value = None
 
@@ -432,10 +637,10 @@ class MercedesMeEntity(CoordinatorEntity[MBAPI2020DataUpdateCoordinator], Entity
         Show latest data after startup.
         """
         await super().async_added_to_hass()
-        if not self._attr_should_poll:
+        if self._subscribe_to_push:
             self._car.add_update_listener(self.pushdata_update_callback)
 
-        self.async_schedule_update_ha_state(True)
+        # Poll states are refreshed by the coordinator for all cars, entities only read the car data
         self._handle_coordinator_update()
 
     async def async_will_remove_from_hass(self):
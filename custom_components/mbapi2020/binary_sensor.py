@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
@@ -47,12 +48,14 @@ async def async_setup_entry(
                 if device.device_retrieval_status() in ["VALID", "NOT_RECEIVED", "3", 3]:
                     sensors.append(device)
 
-    async_add_entities(sensors, True)
+    async_add_entities(sensors)
 
 
 class MercedesMEBinarySensor(MercedesMeEntity, BinarySensorEntity, RestoreEntity):
     """Representation of a Sensor."""
 
+    _entity_platform = Platform.BINARY_SENSOR
+
     def flip(self, state):
         """Flip the result."""
         if self._flip_result:
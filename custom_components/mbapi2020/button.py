@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -52,6 +53,8 @@ async def async_setup_entry(
 class MercedesMEButton(MercedesMeEntity, ButtonEntity):
     """Representation of a Sensor."""
 
+    _entity_platform = Platform.BUTTON
+
     async def async_press(self) -> None:
         """Send out a persistent notification."""
         service = getattr(self._coordinator.client, self._sensor_config[3])
@@ -69,6 +69,18 @@ LOGGER = logging.getLogger(__name__)
 DEBUG_SIMULATE_PARTIAL_UPDATES_ONLY = False
 GEOFENCING_MAX_RETRIES = 3
 
+VALUE_KEYS = ("value", "int_value", "double_value", "bool_value")
+UNIT_KEYS = (
+    "distance_unit",
+    "ratio_unit",
+    "clock_hour_unit",
+    "gas_consumption_unit",
+    "pressure_unit",
+    "electricity_consumption_unit",
+    "combustion_consumption_unit",
+    "speed_unit",
+)
+
 
 class Client:  # pylint: disable-too-few-public-methods
     """define the client."""
@@ -108,6 +120,19 @@ class Client:  # pylint: disable-too-few-public-methods
             hass=self._hass, oauth=self.oauth, region=self._region, session_id=self.session_id
         )
         self.cars: dict[str, Car] = {}
+        # Option changes reload the config entry, so the excluded cars are parsed once
+        self._excluded_cars: frozenset[str] = self._parse_excluded_cars()
+
+        # Handlers for specific options, all other options use the generic handler
+        self._option_handlers = {
+            "max_soc": self._get_car_values_handle_max_soc,
+            "chargingBreakClockTimer": self._get_car_values_handle_charging_break_clock_timer,
+            "precondStatus": self._get_car_values_handle_precond_status,
+            "temperature_points_frontLeft": self._get_car_values_handle_temperature_points,
+            "temperature_points_frontRight": self._get_car_values_handle_temperature_points,
+            "temperature_points_rearLeft": self._get_car_values_handle_temperature_points,
+            "temperature_points_rearRight": self._get_car_values_handle_temperature_points,
+        }
 
     @property
     def pin(self) -> str:
@@ -118,12 +143,19 @@ class Client:  # pylint: disable-too-few-public-methods
         return ""
 
     @property
-    def excluded_cars(self):
-        """Return the list of exluded/ignored VIN/FIN."""
-        if self.config_entry:
-            if self.config_entry.options:
-                return self.config_entry.options.get(CONF_EXCLUDED_CARS, [])
-        return []
+    def excluded_cars(self) -> frozenset[str]:
+        """Return the set of exluded/ignored VIN/FIN."""
+        return self._excluded_cars
+
+    def _parse_excluded_cars(self) -> frozenset[str]:
+        """Parse the comma separated excluded cars option."""
+        if not self.config_entry or not self.config_entry.options:
+            return frozenset()
+
+        excluded_cars = self.config_entry.options.get(CONF_EXCLUDED_CARS, "")
+        if isinstance(excluded_cars, str):
+            excluded_cars = excluded_cars.split(",")
+        return frozenset(vin.strip() for vin in excluded_cars if vin and vin.strip())
 
     def on_data(self, data):
         """Define a handler to fire when the data is received."""
@@ -306,10 +338,10 @@ class Client:  # pylint: disable-too-few-public-methods
             )
             return
 
-        car: Car = self.cars.get(received_car_data.get("vin"), Car(received_car_data.get("vin")))
+        car: Car = self.cars[received_car_data.get("vin")]
 
         car.messages_received.update("p" if update_mode else "f")
-        car._last_message_received = int(round(time.time() * 1000))
+        car._last_message_received = time.time_ns() // 1_000_000
 
         if not update_mode:
             car._last_full_message = received_car_data
@@ -409,17 +441,6 @@ class Client:  # pylint: disable-too-few-public-methods
         self.cars[car.finorvin] = car
 
     def _get_car_values(self, car_detail, car_id, class_instance, options, update):
-        # Define handlers for specific options and the generic case
-        option_handlers = {
-            "max_soc": self._get_car_values_handle_max_soc,
-            "chargingBreakClockTimer": self._get_car_values_handle_charging_break_clock_timer,
-            "precondStatus": self._get_car_values_handle_precond_status,
-            "temperature_points_frontLeft": self._get_car_values_handle_temperature_points,
-            "temperature_points_frontRight": self._get_car_values_handle_temperature_points,
-            "temperature_points_rearLeft": self._get_car_values_handle_temperature_points,
-            "temperature_points_rearRight": self._get_car_values_handle_temperature_points,
-        }
-
         if car_detail is None or not car_detail.get("attributes"):
             LOGGER.debug(
                 "get_car_values %s has incomplete update data – attributes not found",
@@ -427,9 +448,11 @@ class Client:  # pylint: disable-too-few-public-methods
             )
             return class_instance
 
+        option_handlers = self._option_handlers
+        generic_handler = self._get_car_values_handle_generic
         for option in options:
             # Select the specific handler or the generic handler
-            handler = option_handlers.get(option, self._get_car_values_handle_generic)
+            handler = option_handlers.get(option, generic_handler)
 
             curr_status = handler(car_detail, class_instance, option, update)
             if curr_status is None:
@@ -453,22 +476,11 @@ class Client:  # pylint: disable-too-few-public-methods
         curr = car_detail.get("attributes", {}).get(option)
         if curr:
             # Simplify value extraction by checking for existing keys
-            value = next((curr[key] for key in ("value", "int_value", "double_value", "bool_value") if key in curr), 0)
+            value = next((curr[key] for key in VALUE_KEYS if key in curr), 0)
             status = curr.get("status", "VALID")
             time_stamp = curr.get("timestamp", 0)
             curr_display_value = curr.get("display_value")
-
-            unit_keys = [
-                "distance_unit",
-                "ratio_unit",
-                "clock_hour_unit",
-                "gas_consumption_unit",
-                "pressure_unit",
-                "electricity_consumption_unit",
-                "combustion_consumption_unit",
-                "speed_unit",
-            ]
-            unit = next((curr[key] for key in unit_keys if key in curr), None)
+            unit = next((curr[key] for key in UNIT_KEYS if key in curr), None)
 
             return CarAttribute(
                 value=value,
@@ -690,7 +702,7 @@ class Client:  # pylint: disable-too-few-public-methods
                         self.cars[vin] = current_car
 
             load_complete = True
-            current_time = int(round(time.time() * 1000))
+            current_time = time.time_ns() // 1_000_000
             for key, value in self.cars.items():
                 LOGGER.debug(
                     "_process_assigned_vehicles - %s - %s - %s - %s",
@@ -1418,11 +1430,9 @@ class Client:  # pylint: disable-too-few-public-methods
 
         if entry_set:
             message.commandRequest.temperature_configure.CopyFrom(config)
-            self._hass.async_add_executor_job(
-                self.write_debug_json_output,
+            self.async_write_debug_json_output(
                 MessageToJson(message, preserving_proto_field_name=True),
                 "out_temperature_",
-                False,
             )
             await self.websocket.call(message.SerializeToString())
             LOGGER.info("End temperature_configure for vin %s", loghelper.Mask_VIN(vin))
@@ -1553,12 +1563,17 @@ class Client:  # pylint: disable-too-few-public-methods
             path = self._debug_save_path
             Path(path).mkdir(parents=True, exist_ok=True)
 
-            current_file = open(f"{path}/{datatype}{int(round(time.time() * 1000))}", "wb")
+            current_file = open(f"{path}/{datatype}{time.time_ns() // 1_000_000}", "wb")
             current_file.write(data.SerializeToString())
             current_file.close()
 
             self.write_debug_json_output(MessageToJson(data, preserving_proto_field_name=True), datatype)
 
+    def async_write_debug_json_output(self, data, datatype, use_dumps: bool = False):
+        """Write text to files based on datatype in the executor, if debug file saving is enabled."""
+        if self.config_entry.options.get(CONF_DEBUG_FILE_SAVE, False):
+            self._hass.async_add_executor_job(self.write_debug_json_output, data, datatype, use_dumps)
+
     def write_debug_json_output(self, data, datatype, use_dumps: bool = False):
         """Write text to files based on datatype."""
         # LOGGER.debug(self.config_entry.options)
@@ -1566,7 +1581,7 @@ class Client:  # pylint: disable-too-few-public-methods
             path = self._debug_save_path
             Path(path).mkdir(parents=True, exist_ok=True)
 
-            current_file = open(f"{path}/{datatype}{int(round(time.time() * 1000))}.json", "w")
+            current_file = open(f"{path}/{datatype}{time.time_ns() // 1_000_000}.json", "w")
             if use_dumps:
                 current_file.write(f"{json.dumps(data, indent=4)}")
             else:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -46,8 +47,13 @@ class MBAPI2020DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _async_update_data(self) -> dict[str, Car]:
         """Update data via library."""
         try:
-            for vin in self.client.cars:
-                await self.client.update_poll_states(vin)
+            results = await asyncio.gather(
+                *[self.client.update_poll_states(vin) for vin in self.client.cars],
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
         except Exception as err:
             raise MbapiError from err
 
@@ -12,6 +12,7 @@ from typing import Optional
 
 from homeassistant.components.device_tracker import SourceType, TrackerEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
@@ -50,12 +51,14 @@ async def async_setup_entry(
             if device.device_retrieval_status() in ["VALID", "NOT_RECEIVED"]:
                 sensor_list.append(device)
 
-    async_add_entities(sensor_list, True)
+    async_add_entities(sensor_list)
 
 
 class MercedesMEDeviceTracker(MercedesMeEntity, TrackerEntity, RestoreEntity):
     """Representation of a Sensor."""
 
+    _entity_platform = Platform.DEVICE_TRACKER
+
     @property
     def latitude(self) -> Optional[float]:
         """Return latitude value of the device."""
@@ -12,7 +12,7 @@ import asyncio
 from homeassistant.components.alarm_control_panel import CodeFormat
 from homeassistant.components.lock import LockEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_CODE
+from homeassistant.const import ATTR_CODE, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
@@ -51,12 +51,14 @@ async def async_setup_entry(
                 )
                 sensor_list.append(device)
 
-    async_add_entities(sensor_list, True)
+    async_add_entities(sensor_list)
 
 
 class MercedesMELock(MercedesMeEntity, LockEntity, RestoreEntity):
     """Representation of a Lock."""
 
+    _entity_platform = Platform.LOCK
+
     async def async_lock(self, **kwargs):
         """Lock the device."""
         old_state = self.is_locked
@@ -110,7 +112,7 @@ class MercedesMELock(MercedesMeEntity, LockEntity, RestoreEntity):
     def is_locked(self):
         """Return true if device is locked."""
 
-        value = self._get_car_value(self._feature_name, self._object_name, self._attrib_name, None)
+        value = self._get_value(self._attrib_name, None)
         if value and int(value) == 0:
             return True
 
@@ -45,6 +45,11 @@ from .helper import UrlHelper as helper
 
 _LOGGER = logging.getLogger(__name__)
 
+# Tokens with less lifetime left are refreshed in the background while still being used
+TOKEN_REFRESH_BUFFER = 300
+# Minimum seconds between background refresh attempts after a failed one
+TOKEN_REFRESH_RETRY_INTERVAL = 60
+
 
 class Oauth:  # pylint: disable-too-few-public-methods
     """define the client."""
@@ -64,6 +69,8 @@ class Oauth:  # pylint: disable-too-few-public-methods
         self.token = None
         self._xsessionid = ""
         self._get_token_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+        self._refresh_failed_at: float | None = None
 
     async def async_request_device_code(self):
         """Refresh the device code."""
@@ -181,17 +188,55 @@ class Oauth:  # pylint: disable-too-few-public-methods
             return None
 
         if self.is_token_expired(token_info):
-            async with self._get_token_lock:
-                _LOGGER.debug("%s token expired -> start refresh", __name__)
-                if not token_info or "refresh_token" not in token_info:
-                    _LOGGER.warning("Refresh token is missing - reauth required")
-                    return None
-
-                token_info = await self.async_refresh_access_token(token_info["refresh_token"], is_retry=False)
+            _LOGGER.debug("%s token expired -> start refresh", __name__)
+            token_info = await self._async_refresh_token(token_info, self.is_token_expired)
+        elif self.is_token_stale(token_info) and self._refresh_task is None and self._may_retry_refresh():
+            # The token is still valid, refresh it without blocking the current request
+            _LOGGER.debug("%s token stale -> start background refresh", __name__)
+            self._refresh_task = self._hass.async_create_background_task(
+                self._async_background_refresh(token_info), "mbapi2020_token_refresh"
+            )
 
         self.token = token_info
         return token_info
 
+    async def _async_refresh_token(self, token_info, needs_refresh):
+        """Refresh the token, only one refresh is in flight at a time."""
+        async with self._get_token_lock:
+            # Another caller may have refreshed the token while we were waiting for the lock
+            if self.token and not needs_refresh(self.token):
+                return self.token
+
+            if not token_info or "refresh_token" not in token_info:
+                _LOGGER.warning("Refresh token is missing - reauth required")
+                return None
+
+            return await self.async_refresh_access_token(token_info["refresh_token"], is_retry=False)
+
+    async def _async_background_refresh(self, token_info):
+        """Refresh a stale token in the background."""
+        try:
+            new_token_info = await self._async_refresh_token(token_info, self.is_token_stale)
+        except Exception as err:
+            _LOGGER.debug("Background token refresh failed: %s", err)
+            new_token_info = None
+        finally:
+            self._refresh_task = None
+
+        if new_token_info:
+            self.token = new_token_info
+            self._refresh_failed_at = None
+        else:
+            # Back off, an expired token is refreshed on the blocking path anyway
+            self._refresh_failed_at = time.monotonic()
+
+    def _may_retry_refresh(self) -> bool:
+        """Check if enough time has passed since the last failed background refresh."""
+        return (
+            self._refresh_failed_at is None
+            or time.monotonic() - self._refresh_failed_at >= TOKEN_REFRESH_RETRY_INTERVAL
+        )
+
     @classmethod
     def is_token_expired(cls, token_info) -> bool:
         """Check if the token is expired."""
@@ -201,6 +246,15 @@ class Oauth:  # pylint: disable-too-few-public-methods
 
         return True
 
+    @classmethod
+    def is_token_stale(cls, token_info) -> bool:
+        """Check if the token is close to expiry and should be refreshed."""
+        if token_info is not None:
+            now = int(time.time())
+            return token_info["expires_at"] - now < TOKEN_REFRESH_BUFFER
+
+        return True
+
     def _save_token_info(self, token_info):
         if self._config_entry:
             _LOGGER.debug(
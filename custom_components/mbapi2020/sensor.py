@@ -10,7 +10,7 @@ from datetime import datetime
 
 from homeassistant.components.sensor import RestoreSensor
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_UNKNOWN
+from homeassistant.const import STATE_UNKNOWN, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -77,7 +77,6 @@ async def async_setup_entry(
                     config=value,
                     vin=car.finorvin,
                     coordinator=coordinator,
-                    should_poll=True,
                 )
                 if device.device_retrieval_status() in ["VALID", "NOT_RECEIVED"] or (
                     value[scf.DEFAULT_VALUE_MODE.value] is not None
@@ -86,12 +85,14 @@ async def async_setup_entry(
                 ):
                     sensor_list.append(device)
 
-    async_add_entities(sensor_list, True)
+    async_add_entities(sensor_list)
 
 
 class MercedesMESensor(MercedesMeEntity, RestoreSensor):
     """Representation of a Sensor."""
 
+    _entity_platform = Platform.SENSOR
+
     @property
     def native_value(self) -> str | int | float | datetime | None:
         """Return the state."""
@@ -126,6 +127,9 @@ class MercedesMESensor(MercedesMeEntity, RestoreSensor):
 class MercedesMESensorPoll(MercedesMeEntity, RestoreSensor):
     """Representation of a Sensor."""
 
+    _entity_platform = Platform.SENSOR
+    _subscribe_to_push = False
+
     @property
     def native_value(self) -> str | int | float | datetime | None:
         """Return the state."""
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import traceback
+from typing import Any
 import uuid
 
 from aiohttp import ClientSession
@@ -139,6 +141,29 @@ class WebApi:
         """Get all car capabilities associated with an vin."""
         return await self._request("get", f"/v1/vehicle/{vin}/capabilities/commands")
 
+    async def get_capabilities_batch(self, vins: list[str]) -> dict[str, dict[str, Any]]:
+        """Get capabilities, command capabilities and rcp support for a list of vins.
+
+        The API offers no bundled endpoint, all requests are sent concurrently instead.
+        Each vin maps to a dict with the keys "capabilities", "commands" and "rcp_supported".
+        A value is either the response (dict | bool) or, if the request failed, the
+        BaseException instance raised by it. Callers have to check for exceptions.
+        """
+        requests = (self.get_car_capabilities, self.get_car_capabilities_commands, self.is_car_rcp_supported)
+        results = await asyncio.gather(
+            *[request(vin) for vin in vins for request in requests],
+            return_exceptions=True,
+        )
+
+        return {
+            vin: {
+                "capabilities": results[index * 3],
+                "commands": results[index * 3 + 1],
+                "rcp_supported": results[index * 3 + 2],
+            }
+            for index, vin in enumerate(vins)
+        }
+
     async def get_car_rcp_supported_settings(self, vin: str):
         """Get all supported car rcp options associated."""
         url = f"{helper.RCP_url(self._region)}/api/v1/vehicles/{vin}/settings"